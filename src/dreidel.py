@@ -17,6 +17,8 @@ class Dreidel:
     
     FACES = ("Nun", "Gimel", "Hey", "Shin")
     
+    __slots__ = ("_lfsr",)
+    
     def __init__(self, seed: int = 1):
         """
         Initialize the dreidel with a seed for the random generator.
@@ -26,12 +28,54 @@ class Dreidel:
         """
         self._lfsr = LFSR32(seed)
     
-    def spin(self) -> str:
+    def spin(self, _faces: tuple[str, ...] = FACES) -> str:
         """
         Spin the dreidel and return the face it lands on.
         
         Returns:
             One of: "Nun", "Gimel", "Hey", "Shin"
         """
-        # TODO: Implement spin using self._lfsr.random_int()
-        raise NotImplementedError("Students must implement spin")
+        # _faces is bound once at definition time, making the lookup a local load
+        return _faces[self._lfsr.random_bits(2)]
+    
+    def spin_index(self) -> int:
+        """
+        Spin the dreidel and return the index of the face it lands on.
+        
+        Cheaper than ``spin()`` for callers that only aggregate counts.
+        
+        Returns:
+            An index 0-3 into ``FACES``.
+        """
+        return self._lfsr.random_bits(2)
+    
+    def spin_indices(self, n: int) -> list[int]:
+        """
+        Spin the dreidel n times and return the face indices.
+        
+        Produces the same indices as calling ``spin_index()`` n times, for
+        callers that only aggregate counts.
+        
+        Args:
+            n: Number of spins.
+        
+        Returns:
+            A list of n indices 0-3 into ``FACES``.
+        """
+        return self._lfsr.random_ints(n, 0, 3)
+    
+    def spin_many(self, n: int) -> list[str]:
+        """
+        Spin the dreidel n times in one call.
+        
+        Produces the same faces as calling ``spin()`` n times, but draws all
+        face indices from the LFSR in a single batch.
+        
+        Args:
+            n: Number of spins.
+        
+        Returns:
+            A list of n faces.
+        """
+        faces = self.FACES
+        return [faces[index] for index in self.spin_indices(n)]
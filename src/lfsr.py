@@ -8,6 +8,86 @@ This configuration produces a sequence with period 2^32 - 1.
 """
 
 
+# Feedback taps at 0-indexed bits 31, 30, 10, 0: bit 31 of the next state is
+# the parity of state & _TAPS. With a right shift, these taps realise the
+# primitive polynomial x^32 + x^22 + x^2 + x + 1 (the 1-indexed tap list
+# 32, 22, 2, 1 read from the other end of the register).
+_TAPS = 0xC0000401
+# Multipliers of the xorshift-multiply output finalizer
+_MIX1 = 0x7FEB352D
+_MIX2 = 0x846CA68B
+
+
+def _gf2_matmul(a: list[int], b: list[int]) -> list[int]:
+    """
+    Compose two 32x32 GF(2) matrices stored as row bitmasks.
+    
+    Args:
+        a: Matrix applied second.
+        b: Matrix applied first.
+    
+    Returns:
+        The rows of the product a * b.
+    """
+    product = []
+    for row in a:
+        acc = 0
+        j = 0
+        while row:
+            if row & 1:
+                acc ^= b[j]
+            row >>= 1
+            j += 1
+        product.append(acc)
+    return product
+
+
+def _lfsr_step(state: int) -> int:
+    """
+    Perform one step of a 32-bit LFSR.
+    
+    Uses taps at 0-indexed bits 31, 30, 10, 0 for a maximal-length sequence.
+    Polynomial: x^32 + x^22 + x^2 + x^1 + 1
+    
+    Args:
+        state: Current state of the LFSR (32-bit unsigned integer).
+              Must be non-zero for proper operation.
+    
+    Returns:
+        Next state of the LFSR (32-bit unsigned integer).
+    """
+    # Feedback is the parity of the taps at 0-indexed positions 31, 30, 10, 0
+    feedback = (state & _TAPS).bit_count() & 1
+    # Shift right and insert feedback bit at MSB; for a 32-bit state the
+    # result already fits in 32 bits, so no final mask is needed
+    return (state >> 1) | (feedback << 31)
+
+
+def _permute(state: int) -> int:
+    """
+    Scramble an LFSR state into an output value.
+    
+    Successive LFSR states are shifted copies of each other, so their
+    bits are strongly correlated. This xorshift-multiply finalizer is a
+    bijection on 32-bit words that spreads every state bit across the
+    whole output.
+    
+    Args:
+        state: LFSR state (32-bit unsigned integer).
+    
+    Returns:
+        The permuted 32-bit value.
+    """
+    state = ((state ^ (state >> 16)) * _MIX1) & 0xFFFFFFFF
+    state = ((state ^ (state >> 15)) * _MIX2) & 0xFFFFFFFF
+    return state ^ (state >> 16)
+
+
+# One LFSR step as a GF(2) matrix: bit i of the next state is the parity of
+# state & _STEP_MATRIX[i]. Bits shift down by one; bit 31 takes the taps.
+_STEP_MATRIX = [1 << (i + 1) for i in range(31)] + [_TAPS]
+
+
 class LFSR32:
     """
     A 32-bit Linear Feedback Shift Register class.
@@ -15,6 +95,11 @@ class LFSR32:
     Provides a pseudo-random number generator using a maximal-length LFSR.
     """
     
+    __slots__ = ("_state",)
+    
+    # Kept for callers that use LFSR32._lfsr32 directly
+    _lfsr32 = staticmethod(_lfsr_step)
+    
     def __init__(self, seed: int = 1):
         """
         Initialize the LFSR with a seed value.
@@ -29,46 +114,231 @@ class LFSR32:
             raise ValueError("Seed must be non-zero for LFSR to function properly")
         self._state = seed & 0xFFFFFFFF
     
-    @staticmethod
-    def _lfsr32(state: int) -> int:
+    def _next(self) -> int:
+        """
+        Advance the LFSR by one step and return the permuted new state.
+        
+        Returns:
+            The next 32-bit pseudo-random value.
+        """
+        self._state = _lfsr_step(self._state)
+        return _permute(self._state)
+    
+    def jump(self, steps: int) -> None:
+        """
+        Advance the LFSR by the given number of steps without stepping through them.
+        
+        Raises the one-step GF(2) matrix to the power ``steps`` by repeated
+        squaring, so the cost grows with log2(steps). Copies of one generator
+        jumped by different distances are offsets into the same sequence of
+        period 2^32 - 1, not independent generators: two copies jumped d steps
+        apart do not overlap only while each draws fewer than d values.
+        
+        Args:
+            steps: Number of steps to advance (non-negative).
+        
+        Raises:
+            ValueError: If steps is negative.
+        """
+        if steps < 0:
+            raise ValueError("steps must be non-negative")
+        state = self._state
+        power = _STEP_MATRIX
+        while steps:
+            if steps & 1:
+                state = sum(((state & row).bit_count() & 1) << i for i, row in enumerate(power))
+            steps >>= 1
+            if steps:
+                power = _gf2_matmul(power, power)
+        self._state = state
+    
+    def random_int(self, min_val: int = 0, max_val: int = 0xFFFFFFFF) -> int:
+        """
+        Generate a random integer in the specified range [min_val, max_val].
+        
+        Uses Lemire's multiply-and-shift reduction, which avoids both the
+        division and the low-value bias of a plain modulo.
+        
+        Args:
+            min_val: Minimum value (inclusive). Defaults to 0.
+            max_val: Maximum value (inclusive). Defaults to 0xFFFFFFFF.
+        
+        Returns:
+            A pseudo-random integer in the specified range.
+        
+        Raises:
+            ValueError: If min_val > max_val or the range spans more than 2^32 values.
+        """
+        if min_val > max_val:
+            raise ValueError("min_val must not be greater than max_val")
+        range_size = max_val - min_val + 1
+        if range_size > 0x100000000:
+            raise ValueError("Range must span at most 2^32 values")
+        # LFSR step and output permutation inlined to save the _next() call
+        state = self._state
+        feedback = (state & _TAPS).bit_count() & 1
+        self._state = state = (state >> 1) | (feedback << 31)
+        value = ((state ^ (state >> 16)) * _MIX1) & 0xFFFFFFFF
+        value = ((value ^ (value >> 15)) * _MIX2) & 0xFFFFFFFF
+        value ^= value >> 16
+        if range_size == 0x100000000:
+            return min_val + value
+        m = value * range_size
+        if (m & 0xFFFFFFFF) < range_size:
+            # Rare slow path: reject the few values that would bias the result
+            threshold = 0x100000000 % range_size
+            while (m & 0xFFFFFFFF) < threshold:
+                m = self._next() * range_size
+        return min_val + (m >> 32)
+    
+    def random_bits(self, nbits: int) -> int:
         """
-        Perform one step of a 32-bit LFSR.
+        Generate a random integer with the given number of bits.
         
-        Uses taps at positions 32, 22, 2, 1 (1-indexed) for maximal length sequence.
-        Polynomial: x^32 + x^22 + x^2 + x^1 + 1
+        Returns the top ``nbits`` bits of the next value. This is exactly
+        ``random_int(0, 2**nbits - 1)``, since a power-of-two range needs no
+        rejection, but skips the range checks and the multiply.
         
         Args:
-            state: Current state of the LFSR (32-bit unsigned integer).
-                  Must be non-zero for proper operation.
+            nbits: Number of bits, from 1 to 32.
         
         Returns:
-            Next state of the LFSR (32-bit unsigned integer).
+            A pseudo-random integer in the range [0, 2**nbits - 1].
+        
+        Raises:
+            ValueError: If nbits is not between 1 and 32.
         """
-        # TODO: Implement LFSR step
-        # Hint: XOR taps at positions 32, 22, 2, 1 (0-indexed: 31, 21, 1, 0)
-        # Shift right and insert feedback bit at MSB
-        raise NotImplementedError("Students must implement _lfsr32")
+        if not 1 <= nbits <= 32:
+            raise ValueError("nbits must be between 1 and 32")
+        # LFSR step and output permutation inlined to save the _next() call
+        state = self._state
+        feedback = (state & _TAPS).bit_count() & 1
+        self._state = state = (state >> 1) | (feedback << 31)
+        value = ((state ^ (state >> 16)) * _MIX1) & 0xFFFFFFFF
+        value = ((value ^ (value >> 15)) * _MIX2) & 0xFFFFFFFF
+        return (value ^ (value >> 16)) >> (32 - nbits)
     
-    def _next(self) -> int:
+    def random_float(self) -> float:
         """
-        Advance the LFSR by one step and return the new state.
+        Generate a random float in the range [0.0, 1.0).
+        
+        The top 24 bits of the next value are scaled by 2^-24, which is
+        exact in a double and needs no division.
         
         Returns:
-            The next 32-bit pseudo-random value.
+            A pseudo-random float uniform to 24 bits of precision.
         """
-        self._state = self._lfsr32(self._state)
-        return self._state
+        return (self._next() >> 8) * 5.9604644775390625e-08  # 2^-24
     
-    def random_int(self, min_val: int = 0, max_val: int = 0xFFFFFFFF) -> int:
+    def random_ints(self, n: int, min_val: int = 0, max_val: int = 0xFFFFFFFF) -> list[int]:
         """
-        Generate a random integer in the specified range [min_val, max_val].
+        Generate n random integers in the range [min_val, max_val] in one call.
+        
+        Equivalent to ``[self.random_int(min_val, max_val) for _ in range(n)]``
+        but validates the range once and runs the LFSR step, output
+        permutation and range reduction inline in a single loop, with no
+        per-value function calls.
         
         Args:
+            n: Number of values to generate.
             min_val: Minimum value (inclusive). Defaults to 0.
             max_val: Maximum value (inclusive). Defaults to 0xFFFFFFFF.
         
         Returns:
-            A pseudo-random integer in the specified range.
+            A list of n pseudo-random integers in the specified range.
+        
+        Raises:
+            ValueError: If min_val > max_val or the range spans more than 2^32 values.
+        """
+        if min_val > max_val:
+            raise ValueError("min_val must not be greater than max_val")
+        range_size = max_val - min_val + 1
+        if range_size > 0x100000000:
+            raise ValueError("Range must span at most 2^32 values")
+        state = self._state
+        out = [0] * n
+        # LFSR step and output permutation are inlined to keep the loops call-free,
+        # with the module constants bound to locals
+        taps, mix1, mix2 = _TAPS, _MIX1, _MIX2
+        if range_size & (range_size - 1) == 0:
+            # Power-of-two range, including the full 32-bit range: the top bits
+            # are already unbiased, as in random_bits
+            shift = 33 - range_size.bit_length()
+            for i in range(n):
+                feedback = (state & taps).bit_count() & 1
+                state = (state >> 1) | (feedback << 31)
+                value = ((state ^ (state >> 16)) * mix1) & 0xFFFFFFFF
+                value = ((value ^ (value >> 15)) * mix2) & 0xFFFFFFFF
+                out[i] = min_val + ((value ^ (value >> 16)) >> shift)
+            self._state = state
+            return out
+        threshold = 0x100000000 % range_size
+        for i in range(n):
+            while True:
+                feedback = (state & taps).bit_count() & 1
+                state = (state >> 1) | (feedback << 31)
+                value = ((state ^ (state >> 16)) * mix1) & 0xFFFFFFFF
+                value = ((value ^ (value >> 15)) * mix2) & 0xFFFFFFFF
+                m = (value ^ (value >> 16)) * range_size
+                # Reject the few values that would bias the result
+                if (m & 0xFFFFFFFF) >= threshold:
+                    break
+            out[i] = min_val + (m >> 32)
+        self._state = state
+        return out
+
+
+class BoundedLFSR32(LFSR32):
+    """
+    An LFSR32 that always draws from one fixed range.
+    
+    The range is validated and the Lemire rejection threshold computed once
+    at construction, so each draw skips the checks ``LFSR32.random_int``
+    repeats on every call.
+    """
+    
+    __slots__ = ("_lo", "_range", "_threshold")
+    
+    def __init__(self, seed: int = 1, min_val: int = 0, max_val: int = 0xFFFFFFFF):
+        """
+        Initialize the generator with a seed and a fixed range.
+        
+        Args:
+            seed: Initial LFSR state (must be non-zero). Defaults to 1.
+            min_val: Minimum value (inclusive). Defaults to 0.
+            max_val: Maximum value (inclusive). Defaults to 0xFFFFFFFF.
+        
+        Raises:
+            ValueError: If seed is zero, min_val > max_val or the range spans
+                more than 2^32 values.
+        """
+        if min_val > max_val:
+            raise ValueError("min_val must not be greater than max_val")
+        range_size = max_val - min_val + 1
+        if range_size > 0x100000000:
+            raise ValueError("Range must span at most 2^32 values")
+        super().__init__(seed)
+        self._lo = min_val
+        self._range = range_size
+        self._threshold = 0x100000000 % range_size
+    
+    def next(self) -> int:
+        """
+        Generate the next random integer in the fixed range.
+        
+        Produces the same sequence as calling ``random_int(min_val, max_val)``
+        on an ``LFSR32`` with the same seed.
+        
+        Returns:
+            A pseudo-random integer in [min_val, max_val].
         """
-        # TODO: Implement random integer generation using _next()
-        raise NotImplementedError("Students must implement random_int")
+        # LFSR step and output permutation inlined, as in LFSR32.random_int
+        state = self._state
+        feedback = (state & _TAPS).bit_count() & 1
+        self._state = state = (state >> 1) | (feedback << 31)
+        value = ((state ^ (state >> 16)) * _MIX1) & 0xFFFFFFFF
+        value = ((value ^ (value >> 15)) * _MIX2) & 0xFFFFFFFF
+        m = (value ^ (value >> 16)) * self._range
+        while (m & 0xFFFFFFFF) < self._threshold:
+            m = self._next() * self._range
+        return self._lo + (m >> 32)
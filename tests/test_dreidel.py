@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pytest
 from dreidel import Dreidel
+from lfsr import LFSR32
 
 
 class TestDreidelBasic:
@@ -44,6 +45,36 @@ class TestDreidelBasic:
         seq2 = [dreidel2.spin() for _ in range(20)]
         
         assert seq1 != seq2
+    
+    def test_spin_matches_random_int(self):
+        """Test that spin picks the face given by LFSR32.random_int(0, 3) for the same seed."""
+        dreidel = Dreidel(seed=12345)
+        lfsr = LFSR32(seed=12345)
+        
+        for _ in range(100):
+            assert dreidel.spin() == Dreidel.FACES[lfsr.random_int(0, 3)]
+    
+    def test_spin_index_matches_spin(self):
+        """Test that spin_index returns the index of the face spin would return."""
+        dreidel1 = Dreidel(seed=12345)
+        dreidel2 = Dreidel(seed=12345)
+        
+        for _ in range(100):
+            assert Dreidel.FACES[dreidel1.spin_index()] == dreidel2.spin()
+    
+    def test_spin_indices_matches_spin_index(self):
+        """Test that spin_indices produces the same indices as repeated spin_index calls."""
+        dreidel1 = Dreidel(seed=12345)
+        dreidel2 = Dreidel(seed=12345)
+        
+        assert dreidel1.spin_indices(100) == [dreidel2.spin_index() for _ in range(100)]
+    
+    def test_spin_many_matches_spin(self):
+        """Test that spin_many produces the same faces as repeated spin calls."""
+        dreidel1 = Dreidel(seed=12345)
+        dreidel2 = Dreidel(seed=12345)
+        
+        assert dreidel1.spin_many(100) == [dreidel2.spin() for _ in range(100)]
 
 
 class TestDreidelFairDistribution:
@@ -64,14 +95,14 @@ class TestDreidelFairDistribution:
         dreidel = Dreidel(seed=12345)
         num_spins = 10000
         
-        counts = {"Nun": 0, "Gimel": 0, "Hey": 0, "Shin": 0}
+        counts = [0] * len(Dreidel.FACES)
         for _ in range(num_spins):
-            counts[dreidel.spin()] += 1
+            counts[dreidel.spin_index()] += 1
         
         expected = num_spins / 4  # 2500 each
         
         # Each face should be within 10% of expected
-        for face, count in counts.items():
+        for face, count in zip(Dreidel.FACES, counts):
             assert expected * 0.9 <= count <= expected * 1.1, \
                 f"{face} count {count} is outside expected range [{expected * 0.9}, {expected * 1.1}]"
     
@@ -80,14 +111,14 @@ class TestDreidelFairDistribution:
         dreidel = Dreidel(seed=98765)
         num_spins = 10000
         
-        counts = {"Nun": 0, "Gimel": 0, "Hey": 0, "Shin": 0}
+        counts = [0] * len(Dreidel.FACES)
         for _ in range(num_spins):
-            counts[dreidel.spin()] += 1
+            counts[dreidel.spin_index()] += 1
         
         expected = num_spins / 4
         
         # Calculate chi-squared statistic
-        chi_squared = sum((count - expected) ** 2 / expected for count in counts.values())
+        chi_squared = sum((count - expected) ** 2 / expected for count in counts)
         
         # For 3 degrees of freedom, critical value at p=0.05 is ~7.81
         # Using lenient threshold for pseudo-random generator
@@ -98,11 +129,11 @@ class TestDreidelFairDistribution:
         dreidel = Dreidel(seed=54321)
         num_spins = 5000
         
-        counts = {"Nun": 0, "Gimel": 0, "Hey": 0, "Shin": 0}
+        counts = [0] * len(Dreidel.FACES)
         for _ in range(num_spins):
-            counts[dreidel.spin()] += 1
+            counts[dreidel.spin_index()] += 1
         
-        max_count = max(counts.values())
+        max_count = max(counts)
         max_percentage = max_count / num_spins
         
         assert max_percentage < 0.35, f"A face appeared {max_percentage * 100:.1f}% of the time"
@@ -112,11 +143,11 @@ class TestDreidelFairDistribution:
         dreidel = Dreidel(seed=11111)
         num_spins = 5000
         
-        counts = {"Nun": 0, "Gimel": 0, "Hey": 0, "Shin": 0}
+        counts = [0] * len(Dreidel.FACES)
         for _ in range(num_spins):
-            counts[dreidel.spin()] += 1
+            counts[dreidel.spin_index()] += 1
         
-        min_count = min(counts.values())
+        min_count = min(counts)
         min_percentage = min_count / num_spins
         
         assert min_percentage > 0.15, f"A face appeared only {min_percentage * 100:.1f}% of the time"
@@ -127,14 +158,14 @@ class TestDreidelFairDistribution:
         
         for seed in seeds:
             dreidel = Dreidel(seed=seed)
-            counts = {"Nun": 0, "Gimel": 0, "Hey": 0, "Shin": 0}
+            counts = [0] * len(Dreidel.FACES)
             
             for _ in range(4000):
-                counts[dreidel.spin()] += 1
+                counts[dreidel.spin_index()] += 1
             
             expected = 1000  # 4000 / 4
             
             # Each face should be within 20% of expected
-            for face, count in counts.items():
+            for face, count in zip(Dreidel.FACES, counts):
                 assert expected * 0.8 <= count <= expected * 1.2, \
                     f"Seed {seed}: {face} count {count} outside expected range"
@@ -3,12 +3,13 @@ Pytest tests for the LFSR32 class - testing public API and random properties.
 """
 import sys
 import os
+from collections import Counter
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pytest
-from lfsr import LFSR32
+from lfsr import BoundedLFSR32, LFSR32
 
 
 class TestRandomIntBasic:
@@ -46,6 +47,150 @@ class TestRandomIntBasic:
         for _ in range(100):
             value = lfsr.random_int(min_val=-10, max_val=10)
             assert -10 <= value <= 10
+    
+    def test_random_int_inverted_range_raises_error(self):
+        """Test that min_val greater than max_val raises ValueError."""
+        lfsr = LFSR32(seed=42)
+        with pytest.raises(ValueError, match="min_val must not be greater"):
+            lfsr.random_int(min_val=10, max_val=1)
+    
+    def test_random_int_full_width_offset_range(self):
+        """Test random_int with a 2^32-wide range not starting at zero."""
+        lfsr = LFSR32(seed=42)
+        
+        for _ in range(100):
+            value = lfsr.random_int(min_val=-0x80000000, max_val=0x7FFFFFFF)
+            assert -0x80000000 <= value <= 0x7FFFFFFF
+    
+    def test_random_bits_matches_power_of_two_range(self):
+        """Test that random_bits(n) matches random_int over [0, 2**n - 1]."""
+        lfsr1 = LFSR32(seed=12345)
+        lfsr2 = LFSR32(seed=12345)
+        
+        for nbits in (1, 2, 7, 32):
+            for _ in range(50):
+                assert lfsr1.random_bits(nbits) == lfsr2.random_int(0, (1 << nbits) - 1)
+    
+    def test_random_bits_invalid_width_raises_error(self):
+        """Test that random_bits rejects widths outside 1-32."""
+        lfsr = LFSR32(seed=42)
+        for nbits in (0, 33, -1):
+            with pytest.raises(ValueError, match="nbits must be between 1 and 32"):
+                lfsr.random_bits(nbits)
+    
+    def test_random_float_within_unit_interval(self):
+        """Test random_float stays within [0.0, 1.0)."""
+        lfsr = LFSR32(seed=42)
+        
+        for _ in range(1000):
+            value = lfsr.random_float()
+            assert 0.0 <= value < 1.0
+    
+    def test_jump_matches_stepping(self):
+        """Test that jump(k) lands on the same sequence as drawing k values."""
+        lfsr1 = LFSR32(seed=12345)
+        lfsr2 = LFSR32(seed=12345)
+        
+        lfsr1.jump(1000)
+        lfsr2.random_ints(1000)
+        
+        assert lfsr1.random_ints(10) == lfsr2.random_ints(10)
+    
+    def test_full_period(self):
+        """Test that the LFSR returns to its seed state after 2^32 - 1 steps."""
+        lfsr1 = LFSR32(seed=12345)
+        lfsr2 = LFSR32(seed=12345)
+        
+        lfsr1.jump(2**32 - 1)
+        
+        assert lfsr1.random_ints(10) == lfsr2.random_ints(10)
+    
+    def test_no_shorter_period(self):
+        """Test that no proper divisor of 2^32 - 1 is a period of the LFSR."""
+        # 2^32 - 1 = 3 * 5 * 17 * 257 * 65537
+        for factor in (3, 5, 17, 257, 65537):
+            lfsr1 = LFSR32(seed=12345)
+            lfsr2 = LFSR32(seed=12345)
+            
+            lfsr1.jump((2**32 - 1) // factor)
+            
+            assert lfsr1.random_ints(10) != lfsr2.random_ints(10)
+    
+    def test_jump_negative_steps_raises_error(self):
+        """Test that a negative jump raises ValueError."""
+        lfsr = LFSR32(seed=42)
+        with pytest.raises(ValueError, match="steps must be non-negative"):
+            lfsr.jump(-1)
+    
+    def test_random_ints_length_and_range(self):
+        """Test random_ints returns n values within 32-bit range."""
+        lfsr = LFSR32(seed=42)
+        values = lfsr.random_ints(100)
+        
+        assert len(values) == 100
+        assert all(0 <= value <= 0xFFFFFFFF for value in values)
+    
+    def test_random_ints_continues_sequence(self):
+        """Test that consecutive batches continue the same sequence."""
+        lfsr1 = LFSR32(seed=12345)
+        lfsr2 = LFSR32(seed=12345)
+        
+        assert lfsr1.random_ints(10) + lfsr1.random_ints(10) == lfsr2.random_ints(20)
+    
+    def test_random_ints_matches_random_int(self):
+        """Test that random_ints with a custom range matches repeated random_int calls."""
+        lfsr1 = LFSR32(seed=12345)
+        lfsr2 = LFSR32(seed=12345)
+        
+        for min_val, max_val in ((-5, 6), (-4, 3), (10, 10)):
+            expected = [lfsr2.random_int(min_val, max_val) for _ in range(100)]
+            assert lfsr1.random_ints(100, min_val, max_val) == expected
+    
+    def test_random_int_rejection_path_matches_random_ints(self):
+        """Test random_int against random_ints on a range that often rejects draws."""
+        # 2^32 % 0xC0000000 is 0x40000000, so about a quarter of draws are rejected
+        lfsr1 = LFSR32(seed=12345)
+        lfsr2 = LFSR32(seed=12345)
+        
+        expected = [lfsr2.random_int(0, 0xBFFFFFFF) for _ in range(1000)]
+        assert lfsr1.random_ints(1000, 0, 0xBFFFFFFF) == expected
+    
+    def test_next_matches_random_ints(self):
+        """Test that the single-step _next matches the inlined random_ints loop."""
+        lfsr1 = LFSR32(seed=12345)
+        lfsr2 = LFSR32(seed=12345)
+        
+        assert [lfsr1._next() for _ in range(100)] == lfsr2.random_ints(100)
+    
+    def test_random_ints_inverted_range_raises_error(self):
+        """Test that random_ints rejects min_val greater than max_val."""
+        lfsr = LFSR32(seed=42)
+        with pytest.raises(ValueError, match="min_val must not be greater"):
+            lfsr.random_ints(10, min_val=10, max_val=1)
+
+
+class TestBoundedLFSR32:
+    """Tests for the fixed-range BoundedLFSR32 generator."""
+    
+    def test_zero_seed_raises_error(self):
+        """Test that zero seed raises ValueError."""
+        with pytest.raises(ValueError, match="Seed must be non-zero"):
+            BoundedLFSR32(seed=0, min_val=0, max_val=3)
+    
+    def test_inverted_range_raises_error(self):
+        """Test that min_val greater than max_val raises ValueError at construction."""
+        with pytest.raises(ValueError, match="min_val must not be greater"):
+            BoundedLFSR32(seed=42, min_val=10, max_val=1)
+    
+    def test_matches_random_int(self):
+        """Test that next() follows the same sequence as LFSR32.random_int."""
+        # 0..0xBFFFFFFF rejects about a quarter of draws
+        for min_val, max_val in ((0, 3), (1, 100), (-10, 10), (0, 0xBFFFFFFF), (0, 0xFFFFFFFF)):
+            bounded = BoundedLFSR32(seed=12345, min_val=min_val, max_val=max_val)
+            lfsr = LFSR32(seed=12345)
+            
+            for _ in range(100):
+                assert bounded.next() == lfsr.random_int(min_val, max_val)
 
 
 class TestRandomProperties:
@@ -78,7 +223,8 @@ class TestRandomProperties:
         values = [lfsr.random_int(0, num_buckets - 1) for _ in range(num_samples)]
         
         # Count occurrences in each bucket
-        counts = [values.count(i) for i in range(num_buckets)]
+        value_counts = Counter(values)
+        counts = [value_counts[i] for i in range(num_buckets)]
         
         # Each bucket should have roughly num_samples / num_buckets occurrences
         expected = num_samples / num_buckets
@@ -129,8 +275,8 @@ class TestRandomProperties:
         num_categories = 6  # Like a die
         
         observed = [0] * num_categories
-        for _ in range(num_samples):
-            observed[lfsr.random_int(0, num_categories - 1)] += 1
+        for value in lfsr.random_ints(num_samples, 0, num_categories - 1):
+            observed[value] += 1
         
         expected = num_samples / num_categories
         
@@ -147,10 +293,19 @@ class TestRandomProperties:
         min_val, max_val = 0, 100
         num_samples = 10000
         
-        values = [lfsr.random_int(min_val, max_val) for _ in range(num_samples)]
+        values = lfsr.random_ints(num_samples, min_val, max_val)
         mean = sum(values) / len(values)
         
         expected_mean = (min_val + max_val) / 2
         
         # Mean should be within 5% of expected
         assert abs(mean - expected_mean) < expected_mean * 0.05
+    
+    def test_random_float_mean_approximates_half(self):
+        """Test that mean of generated floats approximates 0.5."""
+        lfsr = LFSR32(seed=54321)
+        num_samples = 10000
+        
+        mean = sum(lfsr.random_float() for _ in range(num_samples)) / num_samples
+        
+        assert abs(mean - 0.5) < 0.025